@@ -56,6 +56,7 @@ _IMPORT_STRUCTURE = {
         "MapDataComponent",
         "RepeatedData",
         "ConcatData",
+        "InterleavedConcatData",
         "JoinData",
         "BatchData",
         "CacheData",
@@ -68,6 +69,7 @@ _IMPORT_STRUCTURE = {
         "SerializerCoco",
         "SerializerPdfDoc",
         "MultiThreadMapData",
+        "MultiThreadPrefetchData",
         "MultiProcessMapData",
         "DataFromList",
         "DataFromIterable",
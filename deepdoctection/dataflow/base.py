@@ -12,8 +12,9 @@ This file replaces relevant parts of the Dataflow package. Most of the code has
 
 import threading
 from abc import ABC, abstractmethod
-from typing import Any, Iterator, no_type_check
+from typing import Any, Iterator, Optional, no_type_check
 
+from ..utils.detection_types import DatapointSequence
 from ..utils.utils import get_rng
 
 
@@ -109,6 +110,18 @@ class DataFlow:
         """
         raise NotImplementedError
 
+    def materialized_list(self) -> Optional[DatapointSequence]:
+        """
+        * A dataflow can optionally return the list that stores all of its datapoints, if it streams from an
+          in-memory list. Consumers that need all datapoints at once (e.g. for buffering) can then take the list
+          instead of iterating over the dataflow.
+        * The order of the list need not be the order in which `__iter__` yields the datapoints.
+        * The returned list must not be modified by the caller.
+        Returns:
+            list: all datapoints of this dataflow or `None` if the datapoints are not available as list.
+        """
+        return None
+
 
 class RNGDataFlow(DataFlow, ABC):
     """A DataFlow with RNG"""
@@ -12,10 +12,11 @@ Some DataFlow classes for transforming and processing datapoints. Many classes h
 """
 import itertools
 from copy import copy
-from typing import Any, Callable, Iterator, List, Union
+from typing import Any, Callable, Iterator, List, Optional, Union
 
 import tqdm
 
+from ..utils.detection_types import DatapointSequence
 from ..utils.tqdm import get_tqdm, get_tqdm_default_kwargs
 from .base import DataFlow, ProxyDataFlow
 
@@ -184,6 +185,21 @@ class RepeatedData(ProxyDataFlow):
                 yield from self.df
 
 
+def _concat_materialized_lists(df_lists: List[DataFlow]) -> Optional[DatapointSequence]:
+    """
+    Concatenate the materialized lists of some dataflows, provided that every dataflow has one.
+    """
+    lists: List[DatapointSequence] = []
+    for df in df_lists:
+        lst = df.materialized_list()
+        if lst is None:
+            return None
+        lists.append(lst)
+    if len(lists) == 1:
+        return lists[0]
+    return list(itertools.chain.from_iterable(lists))
+
+
 class ConcatData(DataFlow):
     """
     Concatenate several DataFlow.
@@ -210,6 +226,9 @@ class ConcatData(DataFlow):
     def __len__(self) -> int:
         return sum(len(x) for x in self.df_lists)
 
+    def materialized_list(self) -> Optional[DatapointSequence]:
+        return _concat_materialized_lists(self.df_lists)
+
     def __iter__(self) -> Iterator[Any]:
         for df in self.df_lists:
             yield from df
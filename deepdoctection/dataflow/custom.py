@@ -21,10 +21,12 @@ from
 
 <https://github.com/tensorpack/dataflow/blob/master/dataflow/dataflow/common.py>
 """
+import itertools
 from typing import Any, Callable, Iterable, Iterator, List, Optional
 
 import numpy as np
 
+from ..utils.detection_types import DatapointSequence
 from ..utils.error import DataFlowResetStateNotCalledError
 from ..utils.logger import LoggingRecord, logger
 from ..utils.tqdm import get_tqdm
@@ -51,7 +53,8 @@ class CacheData(ProxyDataFlow):
     def __init__(self, df: DataFlow, shuffle: bool = False) -> None:
         """
         :param df: input DataFlow.
-        :param shuffle: whether to shuffle the cache before yielding from it.
+        :param shuffle: whether to shuffle the cache before yielding from it. The cache is shuffled in place, so that
+                        no second copy of the buffered datapoints will be allocated.
         """
         self.shuffle = shuffle
         self.buffer: List[Any] = []
@@ -80,7 +83,7 @@ class CacheData(ProxyDataFlow):
 
     def get_cache(self) -> List[Any]:
         """
-        get the cache of the whole dataflow as a list
+        get the cache of the whole dataflow as a list. The returned list is the buffer itself and not a copy of it.
 
         :return: list of datapoints
         """
@@ -115,13 +118,13 @@ class CustomDataFromList(DataFromList):
 
     def __init__(
         self,
-        lst: List[Any],
+        lst: DatapointSequence,
         shuffle: bool = False,
         max_datapoints: Optional[int] = None,
         rebalance_func: Optional[Callable[[List[Any]], List[Any]]] = None,
     ):
         """
-        :param lst: the input list. Each element represents a datapoint.
+        :param lst: the input list or any other sequence. Each element represents a datapoint.
         :param shuffle: Whether to shuffle the list before streaming.
         :param max_datapoints: The maximum number of datapoints to return before stopping the iteration.
                                If None it streams the whole dataflow.
@@ -138,11 +141,17 @@ class CustomDataFromList(DataFromList):
             return min(self.max_datapoints, len(self.lst))
         return len(self.lst)
 
+    def materialized_list(self) -> Optional[DatapointSequence]:
+        if self.max_datapoints is not None or self.rebalance_func is not None:
+            return None
+        return self.lst
+
     def __iter__(self) -> Iterator[Any]:
         if self.rng is None:
             raise DataFlowResetStateNotCalledError()
+        lst_tmp: DatapointSequence
         if self.rebalance_func is not None:
-            lst_tmp = self.rebalance_func(self.lst)
+            lst_tmp = self.rebalance_func(self.lst if isinstance(self.lst, list) else list(self.lst))
             logger.info(LoggingRecord(f"CustomDataFromList: subset size after re-balancing: {len(lst_tmp)}"))
         else:
             lst_tmp = self.lst
@@ -150,23 +159,10 @@ class CustomDataFromList(DataFromList):
         if self.shuffle:
             idxs = np.arange(len(lst_tmp))
             self.rng.shuffle(idxs)
-            for idx, k in enumerate(idxs):
-                if self.max_datapoints is not None:
-                    if idx < self.max_datapoints:
-                        yield lst_tmp[k]
-                    else:
-                        break
-                else:
-                    yield lst_tmp[k]
+            for k in idxs[: self.max_datapoints]:
+                yield lst_tmp[k]
         else:
-            if self.max_datapoints is not None:
-                for k, _ in enumerate(lst_tmp):
-                    if k < self.max_datapoints:
-                        yield lst_tmp[k]
-                    else:
-                        break
-            else:
-                yield from lst_tmp
+            yield from itertools.islice(lst_tmp, self.max_datapoints)
 
 
 class CustomDataFromIterable(DataFromIterable):
@@ -186,11 +182,4 @@ class CustomDataFromIterable(DataFromIterable):
             self._len = self.max_datapoints
 
     def __iter__(self) -> Any:
-        if self.max_datapoints is not None:
-            for idx, dp in enumerate(self._itr):
-                if idx < self.max_datapoints:
-                    yield dp
-                else:
-                    break
-        else:
-            yield from self._itr
+        yield from itertools.islice(self._itr, self.max_datapoints)
@@ -23,15 +23,16 @@ import uuid
 import weakref
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from typing import Any, Callable, Iterator, List, no_type_check
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, no_type_check
 
 import zmq
 
 from ..utils.concurrency import StoppableThread, enable_death_signal, start_proc_mask_signal
-from ..utils.error import DataFlowTerminatedError
+from ..utils.detection_types import DatapointSequence
+from ..utils.error import DataFlowResetStateNotCalledError, DataFlowTerminatedError
 from ..utils.logger import LoggingRecord, logger
 from .base import DataFlow, DataFlowReentrantGuard, ProxyDataFlow
-from .common import RepeatedData
+from .common import RepeatedData, _concat_materialized_lists
 from .serialize import PickleSerializer
 
 
@@ -279,6 +280,163 @@ class MultiThreadMapData(_ParallelMapData):
             thr.join(timeout=5.0)
 
 
+_PRODUCER_EXHAUSTED = object()
+
+
+class _ProducerError(NamedTuple):
+    exception: Exception
+
+
+class _ProducerWorker(StoppableThread):
+    """
+    Iterates successively over some dataflows and puts all datapoints into a queue. Signals the end of the iteration by
+    putting `_PRODUCER_EXHAUSTED` into the queue.
+    """
+
+    @no_type_check
+    def __init__(self, df_lists, outq, evt):
+        super().__init__(evt)
+        self.df_lists = df_lists
+        self.outq = outq
+        self.daemon = True
+
+    @no_type_check
+    def run(self):
+        try:
+            for df in self.df_lists:
+                for dp in df:
+                    if self.stopped():
+                        return
+                    self.queue_put_stoppable(self.outq, dp)
+        except Exception as exc:  # pylint: disable=W0703
+            self.queue_put_stoppable(self.outq, _ProducerError(exc))
+        finally:
+            self.queue_put_stoppable(self.outq, _PRODUCER_EXHAUSTED)
+
+
+def _iter_from_producers(df_groups: List[List[DataFlow]], buffer_size: int) -> Iterator[Any]:
+    """
+    Start one producer thread for every group of dataflows and yield datapoints in the order they arrive in the queue
+    until all producers are exhausted.
+    """
+    out_queue: queue.Queue[Any] = queue.Queue(maxsize=buffer_size)
+    evt = threading.Event()
+    threads = [_ProducerWorker(df_group, out_queue, evt) for df_group in df_groups]
+    for thr in threads:
+        thr.start()
+    try:
+        num_running = len(threads)
+        while num_running:
+            dp = out_queue.get()
+            if dp is _PRODUCER_EXHAUSTED:
+                num_running -= 1
+                continue
+            if isinstance(dp, _ProducerError):
+                raise dp.exception
+            yield dp
+    finally:
+        evt.set()
+        # free the queue, so that producers waiting to put a datapoint notice the stop signal without a timeout
+        while True:
+            try:
+                out_queue.get_nowait()
+            except queue.Empty:
+                break
+
+
+class MultiThreadPrefetchData(ProxyDataFlow):
+    """
+    Produce the datapoints of a DataFlow in a background thread and put them into a bounded queue. The consumer
+    iterates over the queue, so that the production of the next datapoints (e.g. reading and decoding from disk)
+    overlaps with whatever the consumer is doing in the meantime. The order of the datapoints is preserved.
+
+    **Example:**
+
+            df = dataset.dataflow.build(split="train")
+            df = MultiThreadPrefetchData(df, buffer_size=50)
+            df.reset_state()
+    """
+
+    def __init__(self, df: DataFlow, buffer_size: int = 50) -> None:
+        """
+        :param df: input DataFlow
+        :param buffer_size: maximum number of datapoints that will be held in the queue
+        """
+        super().__init__(df)
+        if buffer_size <= 0:
+            raise ValueError(f"buffer_size must be a positive number, got {buffer_size}")
+        self._buffer_size = buffer_size
+        self._guard: Optional[DataFlowReentrantGuard] = None
+
+    def reset_state(self) -> None:
+        super().reset_state()
+        self._guard = DataFlowReentrantGuard()
+
+    def materialized_list(self) -> Optional[DatapointSequence]:
+        return self.df.materialized_list()
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._guard is None:
+            raise DataFlowResetStateNotCalledError()
+        with self._guard:
+            yield from _iter_from_producers([[self.df]], self._buffer_size)
+
+
+class InterleavedConcatData(DataFlow):
+    """
+    Concatenate several DataFlow like `ConcatData`, but produce the datapoints of the DataFlows in parallel threads
+    that all feed one bounded queue. Datapoints are yielded in the order they arrive, hence the order of the
+    datapoints is not preserved and datapoints from different DataFlows will be interleaved. Iteration stops when all
+    DataFlows are exhausted.
+
+    Threads are useful if producing datapoints is I/O bound (e.g. loading images from disk). If producing is CPU bound
+    consider using processes instead.
+
+    **Example:**
+
+           df_1 = dataset_1.dataflow.build(split="train")
+           df_2 = dataset_2.dataflow.build(split="train")
+           df = InterleavedConcatData([df_1,df_2])
+    """
+
+    def __init__(self, df_lists: List[DataFlow], num_workers: Optional[int] = None, buffer_size: int = 256) -> None:
+        """
+        :param df_lists: a list of DataFlow.
+        :param num_workers: number of threads. If `None` every DataFlow will get its own thread. Otherwise, the
+                            DataFlows will be distributed among the threads and each thread will iterate over its
+                            DataFlows successively.
+        :param buffer_size: maximum number of datapoints that will be held in the queue
+        """
+        if num_workers is None:
+            num_workers = max(len(df_lists), 1)
+        if num_workers <= 0:
+            raise ValueError(f"num_workers must be a positive number, got {num_workers}")
+        if buffer_size <= 0:
+            raise ValueError(f"buffer_size must be a positive number, got {buffer_size}")
+        self.df_lists = df_lists
+        self.num_workers = min(num_workers, len(df_lists))
+        self._buffer_size = buffer_size
+        self._guard: Optional[DataFlowReentrantGuard] = None
+
+    def reset_state(self) -> None:
+        for df in self.df_lists:
+            df.reset_state()
+        self._guard = DataFlowReentrantGuard()
+
+    def __len__(self) -> int:
+        return sum(len(x) for x in self.df_lists)
+
+    def materialized_list(self) -> Optional[DatapointSequence]:
+        return _concat_materialized_lists(self.df_lists)
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._guard is None:
+            raise DataFlowResetStateNotCalledError()
+        with self._guard:
+            df_groups = [self.df_lists[k :: self.num_workers] for k in range(self.num_workers)]
+            yield from _iter_from_producers(df_groups, self._buffer_size)
+
+
 class _MultiProcessZMQDataFlow(DataFlow, ABC):
     def __init__(self) -> None:
         if os.name == "nt":
@@ -16,6 +16,7 @@ from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 
+from ..utils.detection_types import DatapointSequence
 from ..utils.error import DataFlowResetStateNotCalledError
 from .base import DataFlow, RNGDataFlow
 
@@ -23,9 +24,9 @@ from .base import DataFlow, RNGDataFlow
 class DataFromList(RNGDataFlow):
     """Wrap a list of datapoints to a DataFlow"""
 
-    def __init__(self, lst: List[Any], shuffle: bool = True) -> None:
+    def __init__(self, lst: DatapointSequence, shuffle: bool = True) -> None:
         """
-        :param lst: input list. Each element is a datapoint.
+        :param lst: input list or any other sequence. Each element is a datapoint.
         :param shuffle: shuffle data.
         """
         super().__init__()
@@ -35,6 +36,9 @@ class DataFromList(RNGDataFlow):
     def __len__(self) -> int:
         return len(self.lst)
 
+    def materialized_list(self) -> Optional[DatapointSequence]:
+        return self.lst
+
     def __iter__(self) -> Iterator[Any]:
         if not self.shuffle:
             yield from self.lst
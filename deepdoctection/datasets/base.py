@@ -19,19 +19,32 @@
 Module for the base class of datasets.
 """
 
+import mmap
 import os
+import pickle
 import pprint
+import tempfile
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Type, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Literal, Mapping, Optional, Sequence, Tuple, Type, Union
 
 import numpy as np
-
-from ..dataflow import CacheData, ConcatData, CustomDataFromList, DataFlow
+import numpy.typing as npt
+
+from ..dataflow import (
+    CacheData,
+    ConcatData,
+    CustomDataFromList,
+    DataFlow,
+    InterleavedConcatData,
+    MultiThreadPrefetchData,
+)
 from ..datapoint import Image
-from ..utils.detection_types import Pathlike
+from ..utils.detection_types import DatapointSequence, Pathlike
 from ..utils.logger import LoggingRecord, logger
 from ..utils.settings import ObjectTypes, TypeOrStr, get_type
+from ..utils.tqdm import get_tqdm
 from .dataflow_builder import DataFlowBaseBuilder
 from .info import DatasetCategories, DatasetInfo, get_merged_categories
 
@@ -43,20 +56,16 @@ class DatasetBase(ABC):
     together give a complete description of the dataset. Compare some specific dataset cards in the :mod:`instance` .
     """
 
+    __slots__ = ("_dataset_info", "_dataflow_builder", "_available", "__weakref__")
+
     def __init__(self) -> None:
-        assert self._info() is not None, "Dataset requires at least a name defined in DatasetInfo"
-        self._dataset_info = self._info()
+        dataset_info = self._info()
+        assert dataset_info is not None, "Dataset requires at least a name defined in DatasetInfo"
+        self._dataset_info = dataset_info
         self._dataflow_builder = self._builder()
         self._dataflow_builder.categories = self._categories()
         self._dataflow_builder.splits = self._dataset_info.splits
-
-        if not self.dataset_available() and self.is_built_in():
-            logger.warning(
-                LoggingRecord(
-                    f"Dataset {self._dataset_info.name} not locally found. Please download at {self._dataset_info.url}"
-                    f" and place under {self._dataflow_builder.get_workdir()}"
-                )
-            )
+        self._available: Optional[bool] = None
 
     @property
     def dataset_info(self) -> DatasetInfo:
@@ -100,11 +109,38 @@ class DatasetBase(ABC):
     def dataset_available(self) -> bool:
         """
         Datasets must be downloaded and maybe unzipped manually. Checks, if the folder exists, where the dataset is
-        expected.
+        expected. The check is done once when this method is called for the first time. Use `refresh_availability`
+        if the dataset has been placed afterwards.
         """
-        if os.path.isdir(self._dataflow_builder.get_workdir()):
-            return True
-        return False
+        if self._available is None:
+            return self.refresh_availability()
+        return self._available
+
+    def refresh_availability(self) -> bool:
+        """
+        Check again, if the folder exists, where the dataset is expected.
+
+        :return: True if the dataset is available
+        """
+        self._available = os.path.isdir(self._dataflow_builder.get_workdir())
+        return self._available
+
+    def check_available(self) -> bool:
+        """
+        Same as `dataset_available` but logs a warning with download instructions if a built-in dataset has not been
+        found.
+
+        :return: True if the dataset is available
+        """
+        available = self.dataset_available()
+        if not available and self.is_built_in():
+            logger.warning(
+                LoggingRecord(
+                    f"Dataset {self._dataset_info.name} not locally found. Please download at {self._dataset_info.url}"
+                    f" and place under {self._dataflow_builder.get_workdir()}"
+                )
+            )
+        return available
 
     @staticmethod
     def is_built_in() -> bool:
@@ -129,19 +165,112 @@ class _BuiltInDataset(DatasetBase, ABC):
         return True
 
 
+class _MmapRecordList(Sequence[Image]):
+    """
+    Read-only sequence of datapoints that have been pickled into one file. Only the offset and the length of every
+    record are kept in memory. A datapoint will be unpickled from a memory map of the file when it is accessed.
+    Indexing with a slice, an array of indices or a boolean mask returns a new `_MmapRecordList` that shares the
+    memory map.
+    """
+
+    def __init__(self, path: Pathlike, records: npt.NDArray[np.int64], memory_map: Optional[mmap.mmap] = None) -> None:
+        """
+        :param path: The file the datapoints have been pickled into
+        :param records: Array of shape (N,2) with offset and length of every record
+        :param memory_map: An open memory map of the file. If `None` the file will be mapped once it is accessed.
+        """
+        self.path = path
+        self.records = records
+        self._mmap = memory_map
+
+    @classmethod
+    def from_dataflow(cls, df: DataFlow, path: Pathlike) -> "_MmapRecordList":
+        """
+        Stream a dataflow into a file, one pickled record per datapoint.
+
+        :param df: Dataflow
+        :param path: The file to write to. An existing file will be replaced once the dataflow has been streamed.
+                     `_MmapRecordList`s that have been buffered into the replaced file can still be read.
+        :return: `_MmapRecordList` of all datapoints
+        """
+        records = []
+        df.reset_state()
+        # the dataflow might still read from the file at `path`, e.g. when re-buffering a split. Hence, write into a
+        # temporary file and replace `path` only after streaming has finished.
+        file_descriptor, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)), prefix=os.path.basename(path), suffix=".tmp"
+        )
+        try:
+            with open(file_descriptor, "wb") as file, get_tqdm() as status_bar:
+                for dp in df:
+                    payload = pickle.dumps(dp, protocol=pickle.HIGHEST_PROTOCOL)
+                    records.append((file.tell(), len(payload)))
+                    file.write(payload)
+                    status_bar.update()
+            memory_map = None
+            if records:
+                # map the file before replacing, so that this buffer does not depend on what is at `path` later on
+                with open(tmp_path, "rb") as file:
+                    memory_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return cls(path, np.array(records, dtype=np.int64).reshape(-1, 2), memory_map)
+
+    def _get_mmap(self) -> mmap.mmap:
+        if self._mmap is None:
+            with open(self.path, "rb") as file:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, idx: Any) -> Any:
+        if isinstance(idx, (slice, list, np.ndarray)):
+            records = self.records[idx]
+            return _MmapRecordList(self.path, records, self._get_mmap() if len(records) else None)
+        offset, length = self.records[idx]
+        return pickle.loads(self._get_mmap()[offset : offset + length])
+
+    def __iter__(self) -> Iterator[Image]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_mmap"] = None
+        return state
+
+
 class SplitDataFlow(DataFlowBaseBuilder):
     """
     Dataflow builder for splitting datasets
     """
 
-    def __init__(self, train: List[Image], val: List[Image], test: Optional[List[Image]]):
+    __slots__ = ("split_cache",)
+
+    def __init__(self, train: DatapointSequence, val: DatapointSequence, test: Optional[DatapointSequence]):
         """
         :param train: Cached train split
         :param val: Cached val split
         :param test: Cached test split
         """
         super().__init__(location="")
-        self.split_cache: Dict[str, List[Image]]
+        self.split_cache: Dict[str, DatapointSequence]
+        self.set_split_cache(train, val, test)
+
+    def set_split_cache(
+        self, train: DatapointSequence, val: DatapointSequence, test: Optional[DatapointSequence]
+    ) -> None:
+        """
+        Replace the cached splits.
+
+        :param train: Cached train split
+        :param val: Cached val split
+        :param test: Cached test split
+        """
         if test is None:
             self.split_cache = {"train": train, "val": val}
         else:
@@ -150,7 +279,8 @@ class SplitDataFlow(DataFlowBaseBuilder):
     def build(self, **kwargs: Union[str, int]) -> DataFlow:
         """
         Dataflow builder for merged split datasets
-        :param kwargs: Only split and max_datapoints arguments will be considered.
+        :param kwargs: Only split and max_datapoints arguments will be considered. If max_datapoints is not passed the
+                       whole split will be streamed.
         :return: Dataflow
         """
 
@@ -158,12 +288,100 @@ class SplitDataFlow(DataFlowBaseBuilder):
         if not isinstance(split, str):
             raise ValueError("'split' must be a string")
         max_datapoints = kwargs.get("max_datapoints")
-        if isinstance(max_datapoints, str):
-            max_datapoints = int(max_datapoints)
+        max_datapoints = int(max_datapoints) if max_datapoints is not None else None
 
         return CustomDataFromList(self.split_cache[split], max_datapoints=max_datapoints)
 
 
+def _sample_indices(rng: np.random.Generator, number_datapoints: int, size: int) -> npt.NDArray[np.int64]:
+    """
+    Draw `size` distinct indices from `range(number_datapoints)` in random order. If at most a quarter of the indices
+    is drawn, only O(size) memory will be used: Indices are drawn with replacement and duplicates are replaced by new
+    draws until enough distinct indices are available. Otherwise, a permutation of all indices is cut, which then
+    needs less temporary memory.
+
+    :param rng: Random generator
+    :param number_datapoints: Number of indices to draw from
+    :param size: Number of indices to draw
+    :return: Array of distinct indices
+    """
+    if 4 * size > number_datapoints:
+        return rng.permutation(number_datapoints)[:size]
+    indices = np.unique(rng.integers(number_datapoints, size=size))
+    while len(indices) < size:
+        indices = np.unique(np.concatenate([indices, rng.integers(number_datapoints, size=size - len(indices))]))
+    # np.unique sorts the indices
+    rng.shuffle(indices)
+    return indices
+
+
+def _cache_datapoints(child: Union[DataFlow, DataFlowBaseBuilder], **kwargs: Union[str, int]) -> DatapointSequence:
+    """
+    Build the dataflow of a dataflow builder (if necessary) and collect all of its datapoints. Dataflows streaming
+    from in-memory lists will not be iterated.
+
+    :param child: A dataflow or a dataflow builder
+    :param kwargs: arguments for :build() of the dataflow builder
+    :return: All datapoints of the dataflow
+    """
+    df = child.build(**kwargs) if isinstance(child, DataFlowBaseBuilder) else child
+    cache = df.materialized_list()
+    if cache is None:
+        cache = CacheData(df).get_cache()
+    return cache
+
+
+class MergeDataFlow(DataFlowBaseBuilder):
+    """
+    Dataflow builder for merged datasets
+    """
+
+    __slots__ = ("dataflow_builders", "dataflows")
+
+    def __init__(self, *dataflow_builders: DataFlowBaseBuilder):
+        """
+        :param dataflow_builders: The dataflow builders of the merged datasets
+        """
+        super().__init__("")
+        self.dataflow_builders = dataflow_builders
+        self.dataflows: Optional[Tuple[DataFlow, ...]] = None
+
+    def build(self, **kwargs: Union[str, int]) -> DataFlow:
+        """
+        Building the dataflow of merged datasets. No argument will affect the stream if the dataflows have
+        been explicitly passed. Otherwise, all kwargs will be passed to all dataflows. Note that each dataflow
+        will iterate until it is exhausted. To guarantee randomness across different datasets cache all
+        datapoints and shuffle them afterwards (e.g. use :buffer_dataset() ).
+
+        :param kwargs: arguments for :build(). `prefetch` and `num_workers` will not be passed to the
+                       dataflows: If `prefetch>0` the merged dataflow will be produced in a background thread
+                       that keeps up to `prefetch` datapoints in a queue. If `num_workers>1` the dataflows
+                       will be produced in `num_workers` parallel threads and their datapoints will be
+                       interleaved.
+        :return: Dataflow
+        """
+        prefetch = int(kwargs.pop("prefetch", 0))
+        num_workers = int(kwargs.pop("num_workers", 1))
+        df_list = []
+        if self.dataflows is not None:
+            logger.info(LoggingRecord("Will used dataflow from previously explicitly passed configuration"))
+            df_list = list(self.dataflows)
+        else:
+            logger.info(LoggingRecord("Will use the same build setting for all dataflows"))
+            for dataflow_builder in self.dataflow_builders:
+                df_list.append(dataflow_builder.build(**kwargs))
+        df: DataFlow
+        if len(df_list) == 1:
+            df = df_list[0]
+        elif num_workers > 1:
+            return InterleavedConcatData(df_list, num_workers=num_workers, buffer_size=max(prefetch, 256))
+        else:
+            df = ConcatData(df_list)
+        if prefetch > 0:
+            df = MultiThreadPrefetchData(df, buffer_size=prefetch)
+        return df
+
+
 class MergeDataset(DatasetBase):
     """
     A class for merging dataset ready to feed a training or an evaluation script. The dataflow builder will generate
@@ -173,15 +391,22 @@ class MergeDataset(DatasetBase):
 
     When yielding datapoint from :build(), note that one dataset will pass all its samples successively which
     might reduce randomness for training, especially when using datasets from the same domain. Buffering all datasets
-    (without loading heavy components like images) is therefore possible and the merged dataset can be shuffled.
+    (without loading heavy components like images) is therefore possible and the merged dataset can be shuffled. Passing
+    `num_workers>1` to :build() will produce the datasets in parallel threads and interleave their samples.
 
     When the datasets are buffered are split functionality can divide the buffered samples into an train, val and test
     set.
 
+    Note, that the buffered samples `datapoint_list` are not stored in a `list`: It is a NumPy object array or, if the
+    datasets have been buffered into a file, a read-only sequence. Both can be indexed and iterated, but do not support
+    `append` or `+`, and the truth value of an array is ambiguous. Check `len(merge.datapoint_list)` instead of
+    `if merge.datapoint_list:` and convert with `list(merge.datapoint_list)`, if you need to modify the samples.
+
     While the selection of categories is given by the union of all categories of all datasets, sub categories need to
     be handled with care: Only sub categories for one specific category are available provided that every dataset has
     this sub category available for this specific category. The range of sub category values again is defined as the
-    range of all values from all datasets.
+    range of all values from all datasets. Categories are merged once when the `MergeDataset` is instantiated, so
+    filtering categories of the single datasets must be done beforehand.
 
     **Example:**
 
@@ -206,58 +431,37 @@ class MergeDataset(DatasetBase):
                                                           # possibility
     """
 
+    __slots__ = ("datasets", "dataflows", "datapoint_list", "_category_sources", "_merged_categories")
+
     def __init__(self, *datasets: DatasetBase):
         """
         :param datasets: An arbitrary number of datasets
         """
         self.datasets = datasets
         self.dataflows: Optional[Tuple[DataFlow, ...]] = None
-        self.datapoint_list: Optional[List[Image]] = None
+        self.datapoint_list: Optional[Union[npt.NDArray[Any], _MmapRecordList]] = None
+        self._category_sources = tuple(
+            dataset.dataflow.categories for dataset in datasets if dataset.dataflow.categories is not None
+        )
+        self._merged_categories: Optional[DatasetCategories] = None
         super().__init__()
         self._dataset_info.type = datasets[0].dataset_info.type
         self._dataset_info.name = "merge_" + "_".join([dataset.dataset_info.name for dataset in self.datasets])
 
     def _categories(self) -> DatasetCategories:
-        return get_merged_categories(
-            *(dataset.dataflow.categories for dataset in self.datasets if dataset.dataflow.categories is not None)
-        )
+        # the merged datasets are fixed after __init__, so their categories only need to be merged once
+        if self._merged_categories is None:
+            self._merged_categories = self._compute_categories()
+        return self._merged_categories
+
+    def _compute_categories(self) -> DatasetCategories:
+        return get_merged_categories(*self._category_sources)
 
     @classmethod
     def _info(cls) -> DatasetInfo:
         return DatasetInfo(name="merge")
 
     def _builder(self) -> DataFlowBaseBuilder:
-        class MergeDataFlow(DataFlowBaseBuilder):
-            """
-            Dataflow builder for merged datasets
-            """
-
-            def __init__(self, *dataflow_builders: DataFlowBaseBuilder):
-                super().__init__("")
-                self.dataflow_builders = dataflow_builders
-                self.dataflows: Optional[Tuple[DataFlow, ...]] = None
-
-            def build(self, **kwargs: Union[str, int]) -> DataFlow:
-                """
-                Building the dataflow of merged datasets. No argument will affect the stream if the dataflows have
-                been explicitly passed. Otherwise, all kwargs will be passed to all dataflows. Note that each dataflow
-                will iterate until it is exhausted. To guarantee randomness across different datasets cache all
-                datapoints and shuffle them afterwards (e.g. use :buffer_dataset() ).
-
-                :param kwargs: arguments for :build()
-                :return: Dataflow
-                """
-                df_list = []
-                if self.dataflows is not None:
-                    logger.info(LoggingRecord("Will used dataflow from previously explicitly passed configuration"))
-                    return ConcatData(list(self.dataflows))
-
-                logger.info(LoggingRecord("Will use the same build setting for all dataflows"))
-                for dataflow_builder in self.dataflow_builders:
-                    df_list.append(dataflow_builder.build(**kwargs))
-                df = ConcatData(df_list)
-                return df
-
         builder = MergeDataFlow(*(dataset.dataflow for dataset in self.datasets))
         if self.dataflows is not None:
             builder.dataflows = self.dataflows
@@ -275,37 +479,99 @@ class MergeDataset(DatasetBase):
             raise ValueError(
                 f"len(self.datasets) = {len(self.datasets)} must be" f" <= len(self.dataflows) = {len(self.dataflows)}"
             )
-        self._dataflow_builder = self._builder()
-        self._dataflow_builder.categories = self._categories()
+        if isinstance(self._dataflow_builder, MergeDataFlow):
+            self._dataflow_builder.dataflows = self.dataflows
+        else:
+            self._dataflow_builder = self._builder()
+            self._dataflow_builder.categories = self._categories()
 
-    def buffer_datasets(self, **kwargs: Union[str, int]) -> None:
+    def buffer_datasets(
+        self,
+        *,
+        backing: Literal["memory", "mmap"] = "memory",
+        path: Optional[Pathlike] = None,
+        **kwargs: Union[str, int],
+    ) -> None:
         """
         Buffer datasets with given configs. If dataflows are passed explicitly it will cache their streamed output.
 
-        :param kwargs: arguments for :build()
+        With `backing="mmap"` the datapoints will not be kept in memory but pickled one by one into the file `path`.
+        Only offsets into that file will be held and shuffled in memory. Datapoints are loaded from a memory map of
+        the file once they are accessed. Use this if the buffered datasets do not fit into memory.
+
+            merge.buffer_datasets(backing="mmap", path="/path/to/merge.buffer", split="train")
+
+        The buffered datapoints will be stored in `datapoint_list` as NumPy object array (`backing="memory"`) or as
+        read-only sequence of the records in the file (`backing="mmap"`).
+
+        :param backing: Either "memory" or "mmap"
+        :param path: File to buffer the datapoints in. Required if `backing="mmap"`
+        :param kwargs: arguments for :build(). Dataflows streaming from in-memory lists will not be iterated with
+                       `backing="memory"`, their lists will be buffered directly. All other dataflows will be
+                       iterated: Pass `prefetch` to produce their datapoints in a background thread while they are
+                       being cached. With `backing="mmap"`, `num_workers>1` produces the datapoints of the merged
+                       dataflows in parallel threads. With `backing="memory"` and `num_workers>1` every merged
+                       dataset will be built and cached in its own worker thread and `prefetch` will be ignored.
         :return: Dataflow
         """
-        df = self.dataflow.build(**kwargs)
-        self.datapoint_list = CacheData(df, shuffle=True).get_cache()
+        if backing == "mmap":
+            if path is None:
+                raise ValueError("path is required when buffering datasets with backing='mmap'")
+            record_list = _MmapRecordList.from_dataflow(self.dataflow.build(**kwargs), path)
+            np.random.shuffle(record_list.records)
+            self.datapoint_list = record_list
+        elif backing == "memory":
+            num_workers = int(kwargs.get("num_workers", 1))
+            children: Sequence[Union[DataFlow, DataFlowBaseBuilder]] = []
+            if isinstance(self.dataflow, MergeDataFlow):
+                children = self.dataflow.dataflows or self.dataflow.dataflow_builders
+            if num_workers > 1 and len(children) > 1:
+                kwargs.pop("num_workers")
+                kwargs.pop("prefetch", None)
+                with ThreadPoolExecutor(
+                    max_workers=min(num_workers, len(children)), thread_name_prefix="BufferWorker"
+                ) as executor:
+                    futures = [executor.submit(_cache_datapoints, child, **kwargs) for child in children]
+                    caches = [future.result() for future in futures]
+            else:
+                caches = [_cache_datapoints(self.dataflow, **kwargs)]
+            datapoints = np.empty(sum(len(cache) for cache in caches), dtype=object)
+            start = 0
+            for cache in caches:
+                datapoints[start : start + len(cache)] = cache
+                start += len(cache)
+            np.random.shuffle(datapoints)
+            self.datapoint_list = datapoints
+        else:
+            raise ValueError(f"backing must be either 'memory' or 'mmap', got {backing}")
 
-    def split_datasets(self, ratio: float = 0.1, add_test: bool = True) -> None:
+    def split_datasets(self, ratio: float = 0.1, add_test: bool = True, seed: Optional[int] = None) -> None:
         """
         Split cached datasets into train/val(/test).
 
         :param ratio: 1-ratio will be assigned to the train split. The remaining bit will be assigned to val and test
-                      split.
-        :param add_test: Add a test split
+                      split. Val and test split will together contain exactly `round(ratio * N)` datapoints, where
+                      `N` is the number of buffered datapoints. Note, that `round` rounds half to even, e.g.
+                      `ratio=0.05` and `N=10` will give an empty val split.
+        :param add_test: Add a test split. The test split will get `round(ratio * N) // 2` datapoints and the val split
+                         the remaining ones.
+        :param seed: Seed for generating the split. Pass a seed to reproduce a split of the same buffered datasets.
         """
         assert self.datapoint_list is not None, "Datasets need to be buffered before splitting"
         number_datapoints = len(self.datapoint_list)
-        indices = np.random.binomial(1, ratio, number_datapoints)
-        train_dataset = [self.datapoint_list[i] for i in range(number_datapoints) if indices[i] == 0]
-        val_dataset = [self.datapoint_list[i] for i in range(number_datapoints) if indices[i] == 1]
-        test_dataset = None
-
-        if add_test:
-            test_dataset = [dp for id, dp in enumerate(val_dataset) if id % 2]
-            val_dataset = [dp for id, dp in enumerate(val_dataset) if not id % 2]
+        rng = np.random.default_rng(seed)
+        number_val_test = int(round(number_datapoints * ratio))
+        number_test = number_val_test // 2 if add_test else 0
+        # only draw the val and test indices. The buffer has been shuffled already, so train datapoints are taken in
+        # buffer order by masking out val and test.
+        val_test_indices = _sample_indices(rng, number_datapoints, number_val_test)
+        train_mask = np.ones(number_datapoints, dtype=bool)
+        train_mask[val_test_indices] = False
+
+        # the buffer is either an object array or an mmap record list. Both can be indexed with an index array or a mask
+        train_dataset = self.datapoint_list[train_mask]
+        val_dataset = self.datapoint_list[val_test_indices[number_test:]]
+        test_dataset = self.datapoint_list[val_test_indices[:number_test]] if add_test else None
 
         logger.info(LoggingRecord("___________________ Number of datapoints per split ___________________"))
         logger.info(
@@ -320,8 +586,16 @@ class MergeDataset(DatasetBase):
             )
         )
 
-        self._dataflow_builder = SplitDataFlow(train_dataset, val_dataset, test_dataset)
-        self._dataflow_builder.categories = self._categories()
+        self._set_split_dataflow(train_dataset, val_dataset, test_dataset)
+
+    def _set_split_dataflow(
+        self, train: DatapointSequence, val: DatapointSequence, test: Optional[DatapointSequence]
+    ) -> None:
+        if isinstance(self._dataflow_builder, SplitDataFlow):
+            self._dataflow_builder.set_split_cache(train, val, test)
+        else:
+            self._dataflow_builder = SplitDataFlow(train, val, test)
+            self._dataflow_builder.categories = self._categories()
 
     def get_ids_by_split(self) -> Dict[str, List[str]]:
         """
@@ -338,7 +612,12 @@ class MergeDataset(DatasetBase):
         return {"train": [], "val": [], "test": []}
 
     def create_split_by_id(
-        self, split_dict: Mapping[str, Sequence[str]], **dataflow_build_kwargs: Union[str, int]
+        self,
+        split_dict: Mapping[str, Sequence[str]],
+        *,
+        backing: Literal["memory", "mmap"] = "memory",
+        path: Optional[Pathlike] = None,
+        **dataflow_build_kwargs: Union[str, int],
     ) -> None:
         """
         Reproducing a dataset split from a dataset or a dataflow by a dict of list of image ids.
@@ -355,6 +634,10 @@ class MergeDataset(DatasetBase):
             merge_2.create_split_by_id(out)   # merge_2 now has the same split as merge
 
         :param split_dict: e.g. `{"train":['ab','ac',...],"val":['bc'],"test":[]}`
+        :param backing: Either "memory" or "mmap". Will be passed to :buffer_datasets()
+        :param path: File to buffer the datapoints in. Will be passed to :buffer_datasets()
+        :param dataflow_build_kwargs: arguments for :build(). `backing` and `path` are reserved for
+                                      :buffer_datasets() and cannot be passed to the dataflow builders.
         """
 
         if set(split_dict.keys()) != {"train", "val", "test"}:
@@ -362,15 +645,16 @@ class MergeDataset(DatasetBase):
         ann_id_to_split = {ann_id: "train" for ann_id in split_dict["train"]}
         ann_id_to_split.update({ann_id: "val" for ann_id in split_dict["val"]})
         ann_id_to_split.update({ann_id: "test" for ann_id in split_dict["test"]})
-        self.buffer_datasets(**dataflow_build_kwargs)
-        split_defaultdict = defaultdict(list)
-        for image in self.datapoint_list:  # type: ignore
-            split_defaultdict[ann_id_to_split[image.image_id]].append(image)
-        train_dataset = split_defaultdict["train"]
-        val_dataset = split_defaultdict["val"]
-        test_dataset = split_defaultdict["test"]
-        self._dataflow_builder = SplitDataFlow(train_dataset, val_dataset, test_dataset)
-        self._dataflow_builder.categories = self._categories()
+        self.buffer_datasets(backing=backing, path=path, **dataflow_build_kwargs)
+        assert self.datapoint_list is not None
+        # only collect the positions of the datapoints, so that the splits are views of the same kind as the buffer
+        split_indices = defaultdict(list)
+        for idx, image in enumerate(self.datapoint_list):
+            split_indices[ann_id_to_split[image.image_id]].append(idx)
+        train_dataset, val_dataset, test_dataset = (
+            self.datapoint_list[np.array(split_indices[split], dtype=np.int64)] for split in ("train", "val", "test")
+        )
+        self._set_split_dataflow(train_dataset, val_dataset, test_dataset)
 
 
 class CustomDataset(DatasetBase):
@@ -42,6 +42,8 @@ class DataFlowBaseBuilder(ABC):
     Such specific transformations should be implemented by transferring a value of the argument `build_mode`.
     """
 
+    __slots__ = ("location", "annotation_files", "_categories", "_splits", "__weakref__")
+
     def __init__(
         self,
         location: Pathlike,
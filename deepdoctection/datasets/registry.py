@@ -47,7 +47,9 @@ def get_dataset(name: str) -> DatasetBase:
     :param name: A dataset name
     :return: An instance of a dataset
     """
-    return dataset_registry.get(name)()
+    dataset = dataset_registry.get(name)()
+    dataset.check_available()
+    return dataset
 
 
 def print_dataset_infos(add_license: bool = True, add_info: bool = True) -> None:
@@ -21,7 +21,7 @@ Typing sheet for the whole package
 
 import queue
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Protocol, Tuple, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, Protocol, Sequence, Tuple, Type, TypeVar, Union
 
 import numpy.typing as npt
 import tqdm
@@ -43,6 +43,9 @@ KeyValue = Union[str, int]
 # Numpy image type
 ImageType = npt.NDArray[uint8]
 
+# Datapoints stored in a list or in an object array
+DatapointSequence = Union[Sequence[Any], npt.NDArray[Any]]
+
 # typing for curry decorator
 DP = TypeVar("DP")
 S = TypeVar("S")
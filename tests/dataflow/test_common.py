@@ -152,6 +152,25 @@ def test_concat_data() -> None:
     assert len(output) == 4
 
 
+@mark.basic
+def test_concat_data_materialized_list() -> None:
+    """Test ConcatData returns the datapoints of its children as list only if all children stream from a list"""
+
+    # Arrange
+    dataflow_list_1 = [{"foo": "1"}, {"foo": "3"}]
+    dataflow_list_2 = [{"foo": "2"}, {"foo": "4"}]
+    df_1 = DataFromList(dataflow_list_1, shuffle=False)
+    df_2 = DataFromList(dataflow_list_2, shuffle=False)
+
+    # Act
+    materialized = ConcatData([df_1, df_2]).materialized_list()
+    not_materialized = ConcatData([df_1, MapData(df_2, lambda dp: dp)]).materialized_list()
+
+    # Assert
+    assert materialized == dataflow_list_1 + dataflow_list_2
+    assert not_materialized is None
+
+
 @mark.basic
 def test_join_data() -> None:
     """Test JoinData"""
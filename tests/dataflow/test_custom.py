@@ -20,9 +20,10 @@ Testing the module dataflow.custom
 """
 from typing import Any, List, Union
 
+import numpy as np
 from pytest import mark
 
-from deepdoctection.dataflow import CacheData, CustomDataFromList
+from deepdoctection.dataflow import CacheData, CustomDataFromIterable, CustomDataFromList
 
 
 @mark.basic
@@ -43,6 +44,22 @@ def test_dataflow_cached_in_list(datapoint_list: List[Any]) -> None:
     assert set(df_list) == set(datapoint_list)
 
 
+@mark.basic
+def test_dataflow_cached_in_list_shuffles_buffer_in_place(datapoint_list: List[Any]) -> None:
+    """
+    Testing CacheData get_cache method with shuffle does not return a copy of the buffer
+    """
+    # Arrange
+    df = CacheData(CustomDataFromList(datapoint_list), shuffle=True)
+
+    # Act
+    df_list = df.get_cache()
+
+    # Assert
+    assert df_list is df.buffer
+    assert sorted(df_list) == sorted(datapoint_list)
+
+
 @mark.basic
 def test_dataflow_from_list_with_max_datapoint(datapoint_list: List[Any]) -> None:
     """
@@ -58,3 +75,50 @@ def test_dataflow_from_list_with_max_datapoint(datapoint_list: List[Any]) -> Non
     # Assert
     assert len(df) == 3
     assert len(df_list) == 3
+
+
+@mark.basic
+def test_dataflow_from_list_with_max_datapoint_and_shuffle(datapoint_list: List[Any]) -> None:
+    """
+    Testing CustomDataFromList max_datapoint argument when shuffling the list
+    """
+    # Act
+    df = CustomDataFromList(datapoint_list, shuffle=True, max_datapoints=3)
+    df.reset_state()
+    df_list = list(df)
+
+    # Assert
+    assert len(df_list) == 3
+    assert set(df_list) <= set(datapoint_list)
+
+
+@mark.basic
+def test_dataflow_from_iterable_with_max_datapoint(datapoint_list: List[Any]) -> None:
+    """
+    Testing CustomDataFromIterable max_datapoint argument
+    """
+    # Act
+    df = CustomDataFromIterable(iter(datapoint_list), max_datapoints=2)
+    df.reset_state()
+    df_list = list(df)
+
+    # Assert
+    assert df_list == datapoint_list[:2]
+
+
+@mark.basic
+def test_dataflow_from_object_array_with_rebalance_func(datapoint_list: List[Any]) -> None:
+    """
+    Testing CustomDataFromList streams from an object array and passes a list to the re-balancing function
+    """
+    # Arrange
+    datapoints = np.empty(len(datapoint_list), dtype=object)
+    datapoints[:] = datapoint_list
+
+    # Act
+    df = CustomDataFromList(datapoints, rebalance_func=lambda lst: lst[1:])
+    df.reset_state()
+    df_list = list(df)
+
+    # Assert
+    assert df_list == datapoint_list[1:]
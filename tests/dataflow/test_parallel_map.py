@@ -18,12 +18,22 @@
 """
 Testing module dataflow.parallel_map
 """
-from typing import no_type_check
+import threading
+import time
+from typing import Optional, no_type_check
 
 import numpy as np
-from pytest import mark
-
-from deepdoctection.dataflow import DataFlow, FakeData, MultiThreadMapData
+from pytest import mark, raises
+
+from deepdoctection.dataflow import (
+    DataFlow,
+    DataFromList,
+    FakeData,
+    InterleavedConcatData,
+    MapData,
+    MultiThreadMapData,
+    MultiThreadPrefetchData,
+)
 
 from ..test_utils import collect_datapoint_from_dataflow
 
@@ -64,3 +74,85 @@ def test_multithread_map_data_strict() -> None:
 
     # Assert
     assert len(output) == 10
+
+
+@mark.basic
+def test_multithread_prefetch_data() -> None:
+    """Test MultiThreadPrefetchData preserves all datapoints and their order"""
+
+    # Arrange
+    df: DataFlow
+    df = DataFromList(list(range(100)), shuffle=False)
+
+    # Act
+    df = MultiThreadPrefetchData(df, buffer_size=8)
+    output = collect_datapoint_from_dataflow(df)
+
+    # Assert
+    assert output == list(range(100))
+
+
+@mark.basic
+def test_multithread_prefetch_data_reraises_producer_exception() -> None:
+    """Test MultiThreadPrefetchData raises an exception of the upstream dataflow in the consumer"""
+
+    # Arrange
+    def raise_at_ten(dp: int) -> int:
+        if dp == 10:
+            raise ValueError("datapoint 10 is broken")
+        return dp
+
+    df: DataFlow
+    df = MapData(DataFromList(list(range(20)), shuffle=False), raise_at_ten)
+    df = MultiThreadPrefetchData(df, buffer_size=4)
+    df.reset_state()
+
+    # Act & Assert
+    with raises(ValueError, match="datapoint 10 is broken"):
+        list(df)
+
+
+@mark.basic
+def test_multithread_prefetch_data_can_be_iterated_again_after_early_exit() -> None:
+    """Test MultiThreadPrefetchData stops its producer on early exit and can be iterated again"""
+
+    # Arrange
+    num_threads = threading.active_count()
+    df = MultiThreadPrefetchData(DataFromList(list(range(100)), shuffle=False), buffer_size=4)
+    df.reset_state()
+
+    # Act
+    for dp in df:
+        if dp == 3:
+            # let the producer fill the queue and wait for a free slot
+            time.sleep(0.1)
+            break
+    for _ in range(100):
+        if threading.active_count() == num_threads:
+            break
+        time.sleep(0.01)
+    num_threads_after_exit = threading.active_count()
+    output = list(df)
+
+    # Assert
+    assert num_threads_after_exit == num_threads
+    assert output == list(range(100))
+
+
+@mark.basic
+@mark.parametrize("num_workers", [None, 1, 2])
+def test_interleaved_concat_data(num_workers: Optional[int]) -> None:
+    """Test InterleavedConcatData yields all datapoints of all dataflows"""
+
+    # Arrange
+    df_1 = DataFromList(list(range(50)), shuffle=False)
+    df_2 = DataFromList(list(range(50, 80)), shuffle=False)
+    df_3 = DataFromList(list(range(80, 100)), shuffle=False)
+
+    # Act
+    df = InterleavedConcatData([df_1, df_2, df_3], num_workers=num_workers, buffer_size=8)
+    output = collect_datapoint_from_dataflow(df)
+
+    # Assert
+    assert len(df) == 100
+    assert sorted(output) == list(range(100))
@@ -0,0 +1,528 @@
+# -*- coding: utf-8 -*-
+# File: test_base.py
+
+# Copyright 2021 Dr. Janis Meyer. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Testing module datasets.base
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Set, Tuple
+from unittest.mock import MagicMock
+
+import numpy as np
+from pytest import MonkeyPatch, mark
+
+from deepdoctection.dataflow import CustomDataFromList, MapData
+from deepdoctection.datapoint import Image
+from deepdoctection.datasets import LayoutTest, MergeDataset
+from deepdoctection.datasets import base as datasets_base
+from deepdoctection.datasets.base import SplitDataFlow, _MmapRecordList, _sample_indices
+from deepdoctection.datasets.dataflow_builder import DataFlowBaseBuilder
+from deepdoctection.datasets.info import DatasetCategories, get_merged_categories
+
+from ..test_utils import collect_datapoint_from_dataflow, get_test_path
+
+
+def get_images(number_images: int) -> List[Image]:
+    """
+    A list of images without any annotations
+    """
+    return [Image(file_name=f"sample_{idx}.png", location="/path/to/dir") for idx in range(number_images)]
+
+
+def get_thread_recorder() -> Tuple[Callable[[Image], Image], Set[str]]:
+    """
+    An identity map function together with the set of names of all threads the function has been called in
+    """
+    thread_names: Set[str] = set()
+
+    def record_thread(dp: Image) -> Image:
+        thread_names.add(threading.current_thread().name)
+        return dp
+
+    return record_thread, thread_names
+
+
+@mark.basic
+def test_merge_dataset_split_datasets() -> None:
+    """
+    test MergeDataset.split_datasets distributes all buffered datapoints among train, val and test split
+    """
+
+    # Arrange
+    images = get_images(100)
+    merge = MergeDataset(LayoutTest())
+    merge.explicit_dataflows(CustomDataFromList(images))
+    merge.buffer_datasets()
+
+    # Act
+    merge.split_datasets(ratio=0.2, add_test=True)
+
+    # Assert
+    train = collect_datapoint_from_dataflow(merge.dataflow.build(split="train"))
+    val = collect_datapoint_from_dataflow(merge.dataflow.build(split="val"))
+    test = collect_datapoint_from_dataflow(merge.dataflow.build(split="test"))
+    assert len(train) + len(val) + len(test) == 100
+    assert {img.image_id for img in train + val + test} == {img.image_id for img in images}
+
+
+@mark.basic
+def test_merge_dataset_split_datasets_without_test() -> None:
+    """
+    test MergeDataset.split_datasets does not generate a test split when add_test=False
+    """
+
+    # Arrange
+    images = get_images(50)
+    merge = MergeDataset(LayoutTest())
+    merge.explicit_dataflows(CustomDataFromList(images))
+    merge.buffer_datasets()
+
+    # Act
+    merge.split_datasets(ratio=0.2, add_test=False)
+    split_ids = merge.get_ids_by_split()
+
+    # Assert
+    assert len(split_ids["train"]) + len(split_ids["val"]) == 50
+    assert not split_ids["test"]
+
+
+@mark.basic
+def test_merge_dataset_buffer_datasets_with_prefetch() -> None:
+    """
+    test MergeDataset.buffer_datasets caches all datapoints when producing them in a background thread
+    """
+
+    # Arrange
+    images = get_images(30)
+    record_thread, thread_names = get_thread_recorder()
+    merge = MergeDataset(LayoutTest())
+    merge.explicit_dataflows(MapData(CustomDataFromList(images), record_thread))
+
+    # Act
+    merge.buffer_datasets(prefetch=4)
+
+    # Assert
+    assert merge.datapoint_list is not None
+    assert {img.image_id for img in merge.datapoint_list} == {img.image_id for img in images}
+    assert thread_names
+    assert threading.main_thread().name not in thread_names
+
+
+@mark.basic
+def test_merge_dataset_buffer_datasets_with_num_workers(tmp_path: Path) -> None:
+    """
+    test MergeDataset.buffer_datasets caches all datapoints when producing the merged dataflows in parallel
+    """
+
+    # Arrange
+    images = get_images(40)
+    record_thread, thread_names = get_thread_recorder()
+    merge = MergeDataset(LayoutTest(), LayoutTest())
+    merge.explicit_dataflows(
+        MapData(CustomDataFromList(images[:25]), record_thread), MapData(CustomDataFromList(images[25:]), record_thread)
+    )
+
+    # Act
+    merge.buffer_datasets(backing="mmap", path=tmp_path / "merge.buffer", num_workers=2)
+
+    # Assert
+    assert merge.datapoint_list is not None
+    assert len(merge.datapoint_list) == 40
+    assert {img.image_id for img in merge.datapoint_list} == {img.image_id for img in images}
+    assert len(thread_names) == 2
+    assert threading.main_thread().name not in thread_names
+
+
+@mark.basic
+def test_merge_dataset_buffer_datasets_caches_dataflows_in_worker_threads() -> None:
+    """
+    test MergeDataset.buffer_datasets caches every merged dataflow in its own worker thread when num_workers > 1
+    """
+
+    # Arrange
+    images = get_images(30)
+    record_thread, thread_names = get_thread_recorder()
+    merge = MergeDataset(LayoutTest(), LayoutTest(), LayoutTest())
+    merge.explicit_dataflows(
+        *(MapData(CustomDataFromList(images[k : k + 10]), record_thread) for k in range(0, 30, 10))
+    )
+
+    # Act
+    merge.buffer_datasets(num_workers=3)
+
+    # Assert
+    assert merge.datapoint_list is not None
+    assert sorted(img.image_id for img in merge.datapoint_list) == sorted(img.image_id for img in images)
+    assert thread_names
+    assert all(name.startswith("BufferWorker") for name in thread_names)
+
+
+@mark.basic
+def test_merge_dataset_buffer_datasets_takes_materialized_list() -> None:
+    """
+    test MergeDataset.buffer_datasets buffers list backed dataflows without iterating them and leaves the lists as is
+    """
+
+    # Arrange
+    class NonIterableDataFromList(CustomDataFromList):
+        """CustomDataFromList that must not be iterated"""
+
+        def __iter__(self) -> Iterator[Any]:
+            raise AssertionError("dataflow must not be iterated")
+
+    images = get_images(20)
+    df = NonIterableDataFromList(list(images))
+    merge = MergeDataset(LayoutTest())
+    merge.explicit_dataflows(df)
+
+    # Act
+    merge.buffer_datasets()
+
+    # Assert
+    assert merge.datapoint_list is not None
+    assert {img.image_id for img in merge.datapoint_list} == {img.image_id for img in images}
+    assert df.lst == images
+
+
+@mark.basic
+def test_merge_dataset_explicit_dataflows_keeps_builder_and_categories() -> None:
+    """
+    test MergeDataset.explicit_dataflows passes dataflows to the existing builder and does not merge categories again
+    """
+
+    # Arrange
+    merge = MergeDataset(LayoutTest())
+    builder = merge.dataflow
+    categories = merge.dataflow.categories
+
+    # Act
+    merge.explicit_dataflows(CustomDataFromList(get_images(5)))
+
+    # Assert
+    assert merge.dataflow is builder
+    assert merge.dataflow.categories is categories
+    assert len(collect_datapoint_from_dataflow(merge.dataflow.build())) == 5
+
+
+@mark.basic
+def test_merge_dataset_buffer_datasets_with_mmap_backing(tmp_path: Path) -> None:
+    """
+    test MergeDataset.buffer_datasets with mmap backing buffers all datapoints into a file and splits them
+    """
+
+    # Arrange
+    images = get_images(60)
+    merge = MergeDataset(LayoutTest())
+    merge.explicit_dataflows(CustomDataFromList(images))
+
+    # Act
+    merge.buffer_datasets(backing="mmap", path=tmp_path / "merge.buffer")
+    merge.split_datasets(ratio=0.2, add_test=True)
+
+    # Assert
+    assert merge.datapoint_list is not None
+    assert len(merge.datapoint_list) == 60
+    split_ids = merge.get_ids_by_split()
+    assert sorted(split_ids["train"] + split_ids["val"] + split_ids["test"]) == sorted(img.image_id for img in images)
+    train = collect_datapoint_from_dataflow(merge.dataflow.build(split="train"))
+    assert all(isinstance(img, Image) for img in train)
+
+
+@mark.basic
+def test_merge_dataset_buffer_datasets_again_to_same_mmap_path(tmp_path: Path) -> None:
+    """
+    test buffering a split into the file that backs the split leaves the split readable
+    """
+
+    # Arrange
+    path = tmp_path / "merge.buffer"
+    merge = MergeDataset(LayoutTest())
+    merge.explicit_dataflows(CustomDataFromList(get_images(30)))
+    merge.buffer_datasets(backing="mmap", path=path)
+    merge.split_datasets(ratio=0.2)
+    split_ids = merge.get_ids_by_split()
+
+    # Act
+    merge.buffer_datasets(backing="mmap", path=path, split="train")
+
+    # Assert
+    assert merge.datapoint_list is not None
+    assert sorted(img.image_id for img in merge.datapoint_list) == sorted(split_ids["train"])
+    assert merge.get_ids_by_split() == split_ids
+    assert [path] == list(tmp_path.iterdir())
+
+
+@mark.basic
+def test_merge_dataset_split_datasets_with_seed() -> None:
+    """
+    test MergeDataset.split_datasets generates splits of exact size that can be reproduced with a seed
+    """
+
+    # Arrange
+    images = get_images(100)
+    merge = MergeDataset(LayoutTest())
+    merge.explicit_dataflows(CustomDataFromList(images))
+    merge.buffer_datasets()
+
+    # Act
+    merge.split_datasets(ratio=0.2, add_test=True, seed=42)
+    first_split_ids = merge.get_ids_by_split()
+    merge.split_datasets(ratio=0.2, add_test=True, seed=42)
+    second_split_ids = merge.get_ids_by_split()
+
+    # Assert
+    assert len(first_split_ids["train"]) == 80
+    assert len(first_split_ids["val"]) == 10
+    assert len(first_split_ids["test"]) == 10
+    assert first_split_ids == second_split_ids
+
+
+@mark.basic
+@mark.parametrize("size", [0, 1, 10, 25, 26, 100])
+def test_sample_indices_draws_distinct_indices(size: int) -> None:
+    """
+    test _sample_indices draws the requested number of distinct indices, for small and for large samples
+    """
+
+    # Act
+    indices = _sample_indices(np.random.default_rng(42), 100, size)
+
+    # Assert
+    assert len(indices) == size
+    assert len(set(indices.tolist())) == size
+    assert all(0 <= idx < 100 for idx in indices)
+
+
+@mark.basic
+def test_dataset_available_is_refreshed() -> None:
+    """
+    test DatasetBase.dataset_available returns the cached check until the availability is refreshed
+    """
+
+    # Arrange
+    layouttest = LayoutTest()
+    available = layouttest.dataset_available()
+    layouttest.dataflow.get_workdir = get_test_path  # type: ignore
+
+    # Act & Assert
+    assert layouttest.dataset_available() == available
+    assert layouttest.refresh_availability()
+    assert layouttest.dataset_available()
+
+
+@mark.basic
+def test_dataset_instantiation_does_not_check_availability(monkeypatch: MonkeyPatch) -> None:
+    """
+    test instantiating a dataset does not look for the dataset in the file system
+    """
+
+    # Arrange
+    get_workdir = MagicMock(return_value=get_test_path())
+    monkeypatch.setattr(DataFlowBaseBuilder, "get_workdir", get_workdir)
+
+    # Act
+    layouttest = LayoutTest()
+
+    # Assert
+    get_workdir.assert_not_called()
+    assert layouttest.dataset_available()
+    get_workdir.assert_called_once()
+
+
+@mark.basic
+def test_check_available_logs_download_hint_for_missing_built_in_dataset(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """
+    test DatasetBase.check_available logs where to download a built-in dataset that has not been found
+    """
+
+    # Arrange
+    logger = MagicMock()
+    monkeypatch.setattr(datasets_base, "logger", logger)
+    monkeypatch.setattr(DataFlowBaseBuilder, "get_workdir", lambda self: tmp_path / "missing")
+    layouttest = LayoutTest()
+
+    # Act
+    available = layouttest.check_available()
+
+    # Assert
+    assert not available
+    logger.warning.assert_called_once()
+    assert f"Please download at {layouttest.dataset_info.url}" in str(logger.warning.call_args[0][0])
+
+
+@mark.basic
+def test_merge_dataflow_returns_single_dataflow() -> None:
+    """
+    test MergeDataFlow.build does not wrap a single dataflow
+    """
+
+    # Arrange
+    df = CustomDataFromList(get_images(5))
+    merge = MergeDataset(LayoutTest())
+    merge.explicit_dataflows(df)
+
+    # Act & Assert
+    assert merge.dataflow.build() is df
+
+
+@mark.basic
+def test_split_dataflow_build_with_and_without_max_datapoints() -> None:
+    """
+    test SplitDataFlow.build streams the whole split if no max_datapoints is passed and truncates it otherwise
+    """
+
+    # Arrange
+    merge = MergeDataset(LayoutTest())
+    merge.explicit_dataflows(CustomDataFromList(get_images(20)))
+    merge.buffer_datasets()
+    merge.split_datasets(ratio=0.5, add_test=False)
+
+    # Act
+    val = collect_datapoint_from_dataflow(merge.dataflow.build(split="val"))
+    val_truncated = collect_datapoint_from_dataflow(merge.dataflow.build(split="val", max_datapoints="3"))
+
+    # Assert
+    assert len(val) == 10
+    assert len(val_truncated) == 3
+
+
+@mark.basic
+def test_merge_dataset_split_datasets_again_reuses_split_dataflow() -> None:
+    """
+    test splitting buffered datasets a second time updates the existing SplitDataFlow
+    """
+
+    # Arrange
+    merge = MergeDataset(LayoutTest())
+    merge.explicit_dataflows(CustomDataFromList(get_images(50)))
+    merge.buffer_datasets()
+    merge.split_datasets(ratio=0.2, add_test=True)
+    builder = merge.dataflow
+
+    # Act
+    merge.split_datasets(ratio=0.4, add_test=False)
+    split_ids = merge.get_ids_by_split()
+
+    # Assert
+    assert merge.dataflow is builder
+    assert len(split_ids["train"]) == 30
+    assert len(split_ids["val"]) == 20
+    assert not split_ids["test"]
+
+
+@mark.basic
+def test_merge_dataset_and_builders_use_slots() -> None:
+    """
+    test MergeDataset and its dataflow builders do not carry an instance dict
+    """
+
+    # Arrange
+    merge = MergeDataset(LayoutTest())
+    merge.explicit_dataflows(CustomDataFromList(get_images(10)))
+    merge_builder = merge.dataflow
+    merge.buffer_datasets()
+    merge.split_datasets(ratio=0.2)
+
+    # Act & Assert
+    assert not hasattr(merge, "__dict__")
+    assert not hasattr(merge_builder, "__dict__")
+    assert not hasattr(merge.dataflow, "__dict__")
+
+
+@mark.basic
+def test_merge_dataset_merges_categories_once(monkeypatch: MonkeyPatch) -> None:
+    """
+    test MergeDataset merges the categories of its datasets only once, even if its dataflow builder is replaced
+    """
+
+    # Arrange
+    calls: List[int] = []
+
+    def count_calls(*categories: DatasetCategories) -> DatasetCategories:
+        calls.append(1)
+        return get_merged_categories(*categories)
+
+    monkeypatch.setattr(datasets_base, "get_merged_categories", count_calls)
+    merge = MergeDataset(LayoutTest(), LayoutTest())
+
+    # Act
+    merge.explicit_dataflows(CustomDataFromList(get_images(10)), CustomDataFromList(get_images(10)))
+    merge.buffer_datasets()
+    merge.split_datasets(ratio=0.2)
+
+    # Assert
+    assert len(calls) == 1
+    assert merge.dataflow.categories is merge._categories()  # pylint: disable=W0212
+
+
+@mark.basic
+def test_merge_dataset_create_split_by_id_with_mmap_backing(tmp_path: Path) -> None:
+    """
+    test MergeDataset.create_split_by_id forwards backing and path to buffer_datasets and reproduces the split
+    """
+
+    # Arrange
+    images = get_images(20)
+    merge = MergeDataset(LayoutTest())
+    merge.explicit_dataflows(CustomDataFromList(images))
+    merge.buffer_datasets()
+    merge.split_datasets(ratio=0.2)
+    split_ids = merge.get_ids_by_split()
+    merge_2 = MergeDataset(LayoutTest())
+    merge_2.explicit_dataflows(CustomDataFromList(images))
+
+    # Act
+    merge_2.create_split_by_id(split_ids, backing="mmap", path=tmp_path / "merge.buffer")
+
+    # Assert
+    assert (tmp_path / "merge.buffer").is_file()
+    assert isinstance(merge_2.dataflow, SplitDataFlow)
+    assert all(isinstance(split, _MmapRecordList) for split in merge_2.dataflow.split_cache.values())
+    assert {split: sorted(ids) for split, ids in merge_2.get_ids_by_split().items()} == {
+        split: sorted(ids) for split, ids in split_ids.items()
+    }
+
+
+@mark.basic
+def test_merge_dataset_create_split_by_id_keeps_object_arrays() -> None:
+    """
+    test MergeDataset.create_split_by_id with memory backing reproduces the split as object arrays
+    """
+
+    # Arrange
+    images = get_images(20)
+    merge = MergeDataset(LayoutTest())
+    merge.explicit_dataflows(CustomDataFromList(images))
+    merge.buffer_datasets()
+    merge.split_datasets(ratio=0.2)
+    split_ids = merge.get_ids_by_split()
+    merge_2 = MergeDataset(LayoutTest())
+    merge_2.explicit_dataflows(CustomDataFromList(images))
+
+    # Act
+    merge_2.create_split_by_id(split_ids)
+
+    # Assert
+    assert isinstance(merge_2.dataflow, SplitDataFlow)
+    assert all(isinstance(split, np.ndarray) for split in merge_2.dataflow.split_cache.values())
+    assert {split: sorted(ids) for split, ids in merge_2.get_ids_by_split().items()} == {
+        split: sorted(ids) for split, ids in split_ids.items()
+    }
@@ -21,7 +21,7 @@ Testing module datasets.instances.registry
 
 from unittest.mock import MagicMock
 
-from pytest import mark
+from pytest import MonkeyPatch, mark
 
 from deepdoctection.datasets.base import DatasetBase
 from deepdoctection.datasets.dataflow_builder import DataFlowBaseBuilder
@@ -73,3 +73,20 @@ def test_dataset_registry_registered_new_dataset() -> None:
 
     # Assert
     assert isinstance(test, TestDataset)
+
+
+@mark.basic
+def test_get_dataset_checks_availability(monkeypatch: MonkeyPatch) -> None:
+    """
+    test get_dataset checks, if the dataset is available
+    """
+
+    # Arrange
+    check_available = MagicMock(return_value=True)
+    monkeypatch.setattr(DatasetBase, "check_available", check_available)
+
+    # Act
+    get_dataset("testlayout")
+
+    # Assert
+    check_available.assert_called_once()